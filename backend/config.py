@@ -12,3 +12,7 @@ class Config:
     UPLOAD_FOLDER = os.getenv('UPLOAD_FOLDER', 'uploads')
     MAX_CONTENT_LENGTH = int(os.getenv('MAX_CONTENT_LENGTH', 16 * 1024 * 1024))  # 16MB
     JWT_ACCESS_TOKEN_EXPIRES = 3600  # 1 hour
+
+    # Startup
+    INIT_DB_ON_STARTUP = os.getenv('INIT_DB_ON_STARTUP', 'true').lower() == 'true'  # false defers to first request
+    STARTUP_TIME_BUDGET = float(os.getenv('STARTUP_TIME_BUDGET', 2.0))  # seconds, 0 disables the warning
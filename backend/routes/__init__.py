@@ -0,0 +1,8 @@
+from routes.main import main_bp
+from routes.auth import auth_bp
+from routes.papers import papers_bp
+from routes.users import users_bp
+from routes.admin import admin_bp
+from routes.statistics import statistics_bp
+
+blueprints = [main_bp, auth_bp, papers_bp, users_bp, admin_bp, statistics_bp]
@@ -0,0 +1,103 @@
+from flask import Blueprint, request, jsonify
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from datetime import datetime
+from models import db, User, ApprovalRequest
+
+admin_bp = Blueprint('admin', __name__, url_prefix='/api/admin')
+
+
+@admin_bp.route('/approval-requests', methods=['GET'])
+@jwt_required()
+def get_approval_requests():
+    """Get all pending approval requests (admin only)"""
+    current_user_identity = get_jwt_identity()
+    
+    if current_user_identity['role'] != 'admin':
+        return jsonify({'error': 'Unauthorized'}), 403
+    
+    status = request.args.get('status', 'pending')
+    requests = ApprovalRequest.query.filter_by(status=status).order_by(ApprovalRequest.created_at.desc()).all()
+    
+    return jsonify([req.to_dict() for req in requests]), 200
+
+
+@admin_bp.route('/approval-requests/<int:request_id>', methods=['PUT'])
+@jwt_required()
+def handle_approval_request(request_id):
+    """Approve or reject an approval request (admin only)"""
+    current_user_identity = get_jwt_identity()
+    
+    if current_user_identity['role'] != 'admin':
+        return jsonify({'error': 'Unauthorized'}), 403
+    
+    approval_request = ApprovalRequest.query.get(request_id)
+    
+    if not approval_request:
+        return jsonify({'error': 'Request not found'}), 404
+    
+    data = request.get_json()
+    action = data.get('action')  # 'approve' or 'reject'
+    
+    if action not in ['approve', 'reject']:
+        return jsonify({'error': 'Invalid action'}), 400
+    
+    approval_request.status = 'approved' if action == 'approve' else 'rejected'
+    approval_request.reviewed_at = datetime.utcnow()
+    approval_request.reviewed_by = current_user_identity['id']
+    approval_request.admin_comment = data.get('comment', '')
+    
+    # Update paper status
+    if action == 'approve':
+        approval_request.paper.status = 'approved'
+    else:
+        approval_request.paper.status = 'rejected'
+    
+    db.session.commit()
+    
+    return jsonify({
+        'message': f'Request {action}d successfully',
+        'request': approval_request.to_dict()
+    }), 200
+
+
+@admin_bp.route('/users', methods=['GET'])
+@jwt_required()
+def get_users():
+    """Get all users (admin only)"""
+    current_user_identity = get_jwt_identity()
+    
+    if current_user_identity['role'] != 'admin':
+        return jsonify({'error': 'Unauthorized'}), 403
+    
+    users = User.query.all()
+    
+    return jsonify([user.to_dict() for user in users]), 200
+
+
+@admin_bp.route('/users/<int:user_id>/role', methods=['PUT'])
+@jwt_required()
+def update_user_role(user_id):
+    """Update user role (admin only)"""
+    current_user_identity = get_jwt_identity()
+    
+    if current_user_identity['role'] != 'admin':
+        return jsonify({'error': 'Unauthorized'}), 403
+    
+    user = User.query.get(user_id)
+    
+    if not user:
+        return jsonify({'error': 'User not found'}), 404
+    
+    data = request.get_json()
+    new_role = data.get('role')
+    
+    if new_role not in ['admin', 'user']:
+        return jsonify({'error': 'Invalid role'}), 400
+    
+    user.role = new_role
+    db.session.commit()
+    
+    return jsonify({
+        'message': 'User role updated successfully',
+        'user': user.to_dict()
+    }), 200
@@ -0,0 +1,84 @@
+from flask import Blueprint, current_app, request, jsonify
+from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
+from models import db, User
+
+auth_bp = Blueprint('auth', __name__, url_prefix='/api/auth')
+
+
+def validate_email_domain(email):
+    """Validate that email belongs to the allowed domain"""
+    return email.endswith(f"@{current_app.config['ALLOWED_EMAIL_DOMAIN']}")
+
+
+@auth_bp.route('/register', methods=['POST'])
+def register():
+    """Register a new user"""
+    data = request.get_json()
+    
+    # Validate required fields
+    if not all(k in data for k in ['email', 'password', 'name']):
+        return jsonify({'error': 'Missing required fields'}), 400
+    
+    # Validate email domain
+    if not validate_email_domain(data['email']):
+        return jsonify({'error': f'Only @{current_app.config["ALLOWED_EMAIL_DOMAIN"]} emails are allowed'}), 400
+    
+    # Check if user already exists
+    if User.query.filter_by(email=data['email']).first():
+        return jsonify({'error': 'User already exists'}), 400
+    
+    # Create new user
+    user = User(
+        email=data['email'],
+        name=data['name'],
+        role='user'  # Default role
+    )
+    user.set_password(data['password'])
+    
+    db.session.add(user)
+    db.session.commit()
+    
+    # Create access token
+    access_token = create_access_token(identity={'id': user.id, 'role': user.role})
+    
+    return jsonify({
+        'message': 'User registered successfully',
+        'user': user.to_dict(),
+        'access_token': access_token
+    }), 201
+
+
+@auth_bp.route('/login', methods=['POST'])
+def login():
+    """Login user"""
+    data = request.get_json()
+    
+    if not all(k in data for k in ['email', 'password']):
+        return jsonify({'error': 'Missing email or password'}), 400
+    
+    user = User.query.filter_by(email=data['email']).first()
+    
+    if not user or not user.check_password(data['password']):
+        return jsonify({'error': 'Invalid email or password'}), 401
+    
+    # Create access token
+    access_token = create_access_token(identity={'id': user.id, 'role': user.role})
+    
+    return jsonify({
+        'message': 'Login successful',
+        'user': user.to_dict(),
+        'access_token': access_token
+    }), 200
+
+
+@auth_bp.route('/me', methods=['GET'])
+@jwt_required()
+def get_current_user():
+    """Get current user info"""
+    current_user_identity = get_jwt_identity()
+    user = User.query.get(current_user_identity['id'])
+    
+    if not user:
+        return jsonify({'error': 'User not found'}), 404
+    
+    return jsonify(user.to_dict()), 200
@@ -0,0 +1,17 @@
+from flask import Blueprint, jsonify
+
+main_bp = Blueprint('main', __name__)
+
+
+@main_bp.route('/', methods=['GET'])
+def home():
+    return jsonify({
+        'message': 'Research Paper Database API',
+        'version': '1.0.0',
+        'endpoints': {
+            'auth': '/api/auth/*',
+            'papers': '/api/papers/*',
+            'admin': '/api/admin/*',
+            'statistics': '/api/statistics'
+        }
+    }), 200
@@ -0,0 +1,233 @@
+from flask import Blueprint, current_app, request, jsonify, send_from_directory
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from werkzeug.utils import secure_filename
+import os
+from datetime import datetime
+from models import db, ResearchPaper, ApprovalRequest
+from sqlalchemy import or_
+
+papers_bp = Blueprint('papers', __name__, url_prefix='/api/papers')
+
+# Allowed file extensions
+ALLOWED_EXTENSIONS = {'pdf'}
+
+def allowed_file(filename):
+    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+
+
+@papers_bp.route('', methods=['GET'])
+@jwt_required()
+def get_papers():
+    """Get all approved papers with optional filters"""
+    current_user_identity = get_jwt_identity()
+    
+    # Base query - only approved papers for regular users
+    if current_user_identity['role'] == 'admin':
+        query = ResearchPaper.query
+    else:
+        query = ResearchPaper.query.filter_by(status='approved')
+    
+    # Apply filters
+    if 'year' in request.args:
+        query = query.filter_by(year=int(request.args['year']))
+    
+    if 'author' in request.args:
+        query = query.filter(ResearchPaper.authors.contains(request.args['author']))
+    
+    if 'journal' in request.args:
+        query = query.filter(ResearchPaper.journal.contains(request.args['journal']))
+    
+    if 'keyword' in request.args:
+        query = query.filter(ResearchPaper.keywords.contains(request.args['keyword']))
+    
+    if 'search' in request.args:
+        search_term = f"%{request.args['search']}%"
+        query = query.filter(
+            or_(
+                ResearchPaper.title.like(search_term),
+                ResearchPaper.authors.like(search_term),
+                ResearchPaper.abstract.like(search_term)
+            )
+        )
+    
+    papers = query.order_by(ResearchPaper.created_at.desc()).all()
+    
+    return jsonify([paper.to_dict() for paper in papers]), 200
+
+
+@papers_bp.route('/<int:paper_id>', methods=['GET'])
+@jwt_required()
+def get_paper(paper_id):
+    """Get a specific paper"""
+    paper = ResearchPaper.query.get(paper_id)
+    
+    if not paper:
+        return jsonify({'error': 'Paper not found'}), 404
+    
+    return jsonify(paper.to_dict()), 200
+
+
+@papers_bp.route('', methods=['POST'])
+@jwt_required()
+def create_paper():
+    """Create a new paper"""
+    current_user_identity = get_jwt_identity()
+    
+    # Get form data
+    data = request.form.to_dict()
+    
+    # Handle PDF upload
+    pdf_filename = None
+    if 'pdf' in request.files:
+        file = request.files['pdf']
+        if file and allowed_file(file.filename):
+            filename = secure_filename(file.filename)
+            # Add timestamp to avoid conflicts
+            filename = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{filename}"
+            file.save(os.path.join(current_app.config['UPLOAD_FOLDER'], filename))
+            pdf_filename = filename
+    
+    # Create paper
+    paper = ResearchPaper(
+        title=data.get('title'),
+        authors=data.get('authors'),
+        year=int(data.get('year', 0)),
+        month=data.get('month'),
+        journal=data.get('journal'),
+        volume=data.get('volume'),
+        number=data.get('number'),
+        pages=data.get('pages'),
+        publisher=data.get('publisher'),
+        doi=data.get('doi'),
+        isbn=data.get('isbn'),
+        issn=data.get('issn'),
+        url=data.get('url'),
+        abstract=data.get('abstract'),
+        keywords=data.get('keywords'),
+        note=data.get('note'),
+        pdf_filename=pdf_filename,
+        user_id=current_user_identity['id'],
+        status='pending' if current_user_identity['role'] == 'user' else 'approved'
+    )
+    
+    db.session.add(paper)
+    db.session.commit()
+    
+    # If user is not admin, create approval request
+    if current_user_identity['role'] == 'user':
+        approval_request = ApprovalRequest(
+            paper_id=paper.id,
+            user_id=current_user_identity['id'],
+            request_type='create'
+        )
+        db.session.add(approval_request)
+        db.session.commit()
+    
+    return jsonify({
+        'message': 'Paper created successfully' if current_user_identity['role'] == 'admin' else 'Paper submitted for approval',
+        'paper': paper.to_dict()
+    }), 201
+
+
+@papers_bp.route('/<int:paper_id>', methods=['PUT'])
+@jwt_required()
+def update_paper(paper_id):
+    """Update a paper"""
+    current_user_identity = get_jwt_identity()
+    paper = ResearchPaper.query.get(paper_id)
+    
+    if not paper:
+        return jsonify({'error': 'Paper not found'}), 404
+    
+    # Check permissions
+    if current_user_identity['role'] != 'admin' and paper.user_id != current_user_identity['id']:
+        return jsonify({'error': 'Unauthorized'}), 403
+    
+    data = request.form.to_dict()
+    
+    # Handle PDF upload
+    if 'pdf' in request.files:
+        file = request.files['pdf']
+        if file and allowed_file(file.filename):
+            # Delete old file if exists
+            if paper.pdf_filename:
+                old_file_path = os.path.join(current_app.config['UPLOAD_FOLDER'], paper.pdf_filename)
+                if os.path.exists(old_file_path):
+                    os.remove(old_file_path)
+            
+            filename = secure_filename(file.filename)
+            filename = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{filename}"
+            file.save(os.path.join(current_app.config['UPLOAD_FOLDER'], filename))
+            paper.pdf_filename = filename
+    
+    # Update fields
+    for field in ['title', 'authors', 'year', 'month', 'journal', 'volume', 'number', 
+                  'pages', 'publisher', 'doi', 'isbn', 'issn', 'url', 'abstract', 
+                  'keywords', 'note']:
+        if field in data:
+            if field == 'year':
+                setattr(paper, field, int(data[field]))
+            else:
+                setattr(paper, field, data[field])
+    
+    # If user is not admin, set status to pending
+    if current_user_identity['role'] == 'user':
+        paper.status = 'pending'
+        # Create approval request
+        approval_request = ApprovalRequest(
+            paper_id=paper.id,
+            user_id=current_user_identity['id'],
+            request_type='update'
+        )
+        db.session.add(approval_request)
+    
+    db.session.commit()
+    
+    return jsonify({
+        'message': 'Paper updated successfully' if current_user_identity['role'] == 'admin' else 'Paper update submitted for approval',
+        'paper': paper.to_dict()
+    }), 200
+
+
+@papers_bp.route('/<int:paper_id>', methods=['DELETE'])
+@jwt_required()
+def delete_paper(paper_id):
+    """Delete a paper"""
+    current_user_identity = get_jwt_identity()
+    paper = ResearchPaper.query.get(paper_id)
+    
+    if not paper:
+        return jsonify({'error': 'Paper not found'}), 404
+    
+    # Only admin can delete
+    if current_user_identity['role'] != 'admin':
+        return jsonify({'error': 'Unauthorized'}), 403
+    
+    # Delete associated approval requests first
+    ApprovalRequest.query.filter_by(paper_id=paper_id).delete()
+    
+    # Delete PDF file if exists
+    if paper.pdf_filename:
+        file_path = os.path.join(current_app.config['UPLOAD_FOLDER'], paper.pdf_filename)
+        if os.path.exists(file_path):
+            try:
+                os.remove(file_path)
+            except Exception as e:
+                print(f"Error deleting file: {e}")
+    
+    db.session.delete(paper)
+    db.session.commit()
+    
+    return jsonify({'message': 'Paper deleted successfully'}), 200
+
+
+@papers_bp.route('/<int:paper_id>/pdf', methods=['GET'])
+@jwt_required()
+def get_paper_pdf(paper_id):
+    """Get PDF file for a paper"""
+    paper = ResearchPaper.query.get(paper_id)
+    
+    if not paper or not paper.pdf_filename:
+        return jsonify({'error': 'PDF not found'}), 404
+    
+    return send_from_directory(current_app.config['UPLOAD_FOLDER'], paper.pdf_filename)
@@ -0,0 +1,58 @@
+from flask import Blueprint, jsonify
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from datetime import datetime
+from models import db, ResearchPaper, ApprovalRequest
+from sqlalchemy import func
+
+statistics_bp = Blueprint('statistics', __name__, url_prefix='/api/statistics')
+
+
+@statistics_bp.route('', methods=['GET'])
+@jwt_required()
+def get_statistics():
+    """Get statistics for dashboard"""
+    current_user_identity = get_jwt_identity()
+    
+    # Total papers (approved only for users)
+    if current_user_identity['role'] == 'admin':
+        total_papers = ResearchPaper.query.count()
+        pending_papers = ResearchPaper.query.filter_by(status='pending').count()
+    else:
+        total_papers = ResearchPaper.query.filter_by(status='approved').count()
+        pending_papers = 0
+    
+    # Papers by year
+    papers_by_year = db.session.query(
+        ResearchPaper.year,
+        func.count(ResearchPaper.id).label('count')
+    ).filter(
+        ResearchPaper.status == 'approved'
+    ).group_by(ResearchPaper.year).order_by(ResearchPaper.year).all()
+    
+    # Papers this year
+    current_year = datetime.now().year
+    papers_this_year = ResearchPaper.query.filter(
+        ResearchPaper.year == current_year,
+        ResearchPaper.status == 'approved'
+    ).count()
+    
+    # My papers (for users)
+    my_papers_count = ResearchPaper.query.filter_by(user_id=current_user_identity['id']).count()
+    
+    # Pending approval requests
+    if current_user_identity['role'] == 'admin':
+        pending_approvals = ApprovalRequest.query.filter_by(status='pending').count()
+    else:
+        pending_approvals = ApprovalRequest.query.filter_by(
+            user_id=current_user_identity['id'],
+            status='pending'
+        ).count()
+    
+    return jsonify({
+        'total_papers': total_papers,
+        'pending_papers': pending_papers,
+        'papers_this_year': papers_this_year,
+        'my_papers_count': my_papers_count,
+        'pending_approvals': pending_approvals,
+        'papers_by_year': [{'year': year, 'count': count} for year, count in papers_by_year]
+    }), 200
@@ -0,0 +1,15 @@
+from flask import Blueprint, jsonify
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from models import ResearchPaper
+
+users_bp = Blueprint('users', __name__, url_prefix='/api/users')
+
+
+@users_bp.route('/my-papers', methods=['GET'])
+@jwt_required()
+def get_my_papers():
+    """Get papers uploaded by current user"""
+    current_user_identity = get_jwt_identity()
+    papers = ResearchPaper.query.filter_by(user_id=current_user_identity['id']).order_by(ResearchPaper.created_at.desc()).all()
+    
+    return jsonify([paper.to_dict() for paper in papers]), 200
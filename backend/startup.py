@@ -0,0 +1,149 @@
+import errno
+import os
+import time
+import zlib
+from contextlib import contextmanager
+from sqlalchemy import text
+from models import db, User
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextmanager
+def file_lock(path):
+    """Hold an exclusive inter-process lock on `path` for the duration of the block"""
+    with open(path, 'a+') as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            # LK_LOCK retries for ~10s before raising, so keep trying until we own the lock
+            while True:
+                try:
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError as e:
+                    if e.errno not in (errno.EDEADLOCK, errno.EACCES):
+                        raise
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def database_lock(app):
+    """Hold a database-level lock so workers on different hosts serialise too
+
+    Uses a session advisory lock on PostgreSQL and GET_LOCK on MySQL. Other
+    backends (SQLite) are only protected by the per-host file lock in init_db().
+    """
+    engine = db.engine
+    backend = engine.url.get_backend_name()
+    if backend not in ('postgresql', 'mysql', 'mariadb'):
+        yield
+        return
+
+    key = zlib.crc32(f'{app.name}:init_db'.encode())
+    with engine.connect() as connection:
+        if backend == 'postgresql':
+            connection.execute(text('SELECT pg_advisory_lock(:key)'), {'key': key})
+        else:
+            connection.execute(text('SELECT GET_LOCK(:key, -1)'), {'key': str(key)})
+        try:
+            yield
+        finally:
+            if backend == 'postgresql':
+                connection.execute(text('SELECT pg_advisory_unlock(:key)'), {'key': key})
+            else:
+                connection.execute(text('SELECT RELEASE_LOCK(:key)'), {'key': str(key)})
+
+
+def init_db(app):
+    """Create tables and seed the default admin, once per database across all workers
+
+    Workers on one host serialise on a lock file in the instance folder, and on
+    PostgreSQL/MySQL also on a database lock. Returns True if this process
+    created the default admin.
+    """
+    os.makedirs(app.instance_path, exist_ok=True)
+    lock_path = os.path.join(app.instance_path, 'init_db.lock')
+
+    with file_lock(lock_path), app.app_context(), database_lock(app):
+        # No local "already initialized" marker: a file on this host can't tell
+        # whether a shared database was dropped or recreated, and trusting it
+        # left workers with no tables. create_all() only creates what's missing,
+        # so running it under the lock costs one schema check per worker start.
+        db.create_all()
+
+        # Create default admin if not exists
+        admin_email = f'admin@{app.config["ALLOWED_EMAIL_DOMAIN"]}'
+        admin = User.query.filter_by(email=admin_email).first()
+        if admin:
+            return False
+
+        admin = User(
+            email=admin_email,
+            name='Admin',
+            role='admin'
+        )
+        admin.set_password('admin123')  # Change this in production!
+        db.session.add(admin)
+        db.session.commit()
+        print(f"Default admin created: {admin_email} / admin123")
+
+    return True
+
+
+def check_budget(app, label, elapsed):
+    """Log how long a startup step took, warning if it went over STARTUP_TIME_BUDGET"""
+    budget = app.config['STARTUP_TIME_BUDGET']
+    if budget and elapsed > budget:
+        app.logger.warning(f"{label} took {elapsed:.3f}s, over the {budget:.3f}s budget")
+    else:
+        app.logger.info(f"{label} took {elapsed:.3f}s")
+
+
+def init_db_lazily(app):
+    """Defer init_db() until the first request this worker serves"""
+    state = {'done': False}
+
+    @app.before_request
+    def ensure_db_initialized():
+        if not state['done']:
+            started = time.perf_counter()
+            init_db(app)
+            elapsed = time.perf_counter() - started
+            app.config['DB_INIT_TIME'] = elapsed
+            check_budget(app, 'Database setup', elapsed)
+            state['done'] = True
+
+
+def run_startup(app, started=None):
+    """Run the one-time startup work and check the total against STARTUP_TIME_BUDGET
+
+    `started` is a time.perf_counter() reading taken when app creation began, so
+    the budget covers extension and blueprint setup as well as the database work.
+    With INIT_DB_ON_STARTUP off, the deferred setup is timed separately as
+    DB_INIT_TIME and checked against the same budget.
+    """
+    if started is None:
+        started = time.perf_counter()
+
+    if app.config['INIT_DB_ON_STARTUP']:
+        init_db(app)
+    else:
+        init_db_lazily(app)
+
+    elapsed = time.perf_counter() - started
+    app.config['STARTUP_TIME'] = elapsed
+    check_budget(app, 'Startup', elapsed)
+    return elapsed
@@ -0,0 +1,27 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+
+
+@pytest.fixture
+def make_config(tmp_path):
+    """Build a Config subclass pointing at a throwaway database and upload folder"""
+    def factory(database_uri=None, **overrides):
+        attrs = {
+            'SQLALCHEMY_DATABASE_URI': database_uri or f"sqlite:///{tmp_path / 'test.db'}",
+            'UPLOAD_FOLDER': str(tmp_path / 'uploads'),
+            'TESTING': True,
+        }
+        attrs.update(overrides)
+        return type('TestConfig', (Config,), attrs)
+    return factory
+
+
+@pytest.fixture
+def instance_path(tmp_path):
+    return str(tmp_path / 'instance')
@@ -0,0 +1,108 @@
+import contextlib
+import io
+import logging
+import multiprocessing
+import time
+
+from sqlalchemy import inspect
+
+from app import create_app
+from config import Config
+from models import db, User
+import startup
+
+
+def admin_login(app):
+    return app.test_client().post('/api/auth/login', json={
+        'email': f'admin@{app.config["ALLOWED_EMAIL_DOMAIN"]}',
+        'password': 'admin123'
+    })
+
+
+def table_names(app):
+    with app.app_context():
+        return set(inspect(db.engine).get_table_names())
+
+
+def start_worker(args):
+    """Create an app in a separate process; returns the admin count it sees and its stdout"""
+    database_uri, upload_folder, instance_path = args
+    config = type('WorkerConfig', (Config,), {
+        'SQLALCHEMY_DATABASE_URI': database_uri,
+        'UPLOAD_FOLDER': upload_folder,
+        'TESTING': True,
+    })
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        app = create_app(config, instance_path)
+    with app.app_context():
+        return User.query.count(), output.getvalue()
+
+
+def test_two_apps_share_fresh_database(make_config, instance_path):
+    config = make_config()
+    first = create_app(config, instance_path)
+    second = create_app(config, instance_path)
+
+    for app in (first, second):
+        assert {'users', 'research_papers', 'approval_requests'} <= table_names(app)
+        assert admin_login(app).status_code == 200
+    with second.app_context():
+        assert User.query.count() == 1
+
+
+def test_concurrent_workers_seed_admin_once(tmp_path, instance_path):
+    args = (f"sqlite:///{tmp_path / 'test.db'}", str(tmp_path / 'uploads'), instance_path)
+    with multiprocessing.get_context('spawn').Pool(8) as pool:
+        results = pool.map(start_worker, [args] * 8)
+
+    assert [count for count, _ in results] == [1] * 8
+    assert sum(output.count('Default admin created') for _, output in results) == 1
+
+
+def test_in_memory_database_always_initialized(make_config, instance_path):
+    config = make_config('sqlite://')
+    first = create_app(config, instance_path)
+    second = create_app(config, instance_path)
+
+    assert admin_login(first).status_code == 200
+    assert admin_login(second).status_code == 200
+
+
+def test_existing_admin_not_recreated(make_config, instance_path):
+    app = create_app(make_config(), instance_path)
+
+    assert startup.init_db(app) is False
+
+
+def test_dropped_tables_rerun_setup(make_config, instance_path):
+    app = create_app(make_config(), instance_path)
+    with app.app_context():
+        db.drop_all()
+
+    assert startup.init_db(app) is True
+    assert admin_login(app).status_code == 200
+
+
+def test_lazy_init_waits_for_first_request(make_config, instance_path):
+    app = create_app(make_config(INIT_DB_ON_STARTUP=False), instance_path)
+    assert table_names(app) == set()
+
+    assert app.test_client().get('/').status_code == 200
+    assert 'users' in table_names(app)
+    assert app.config['DB_INIT_TIME'] > 0
+
+
+def test_startup_time_covers_db_setup(make_config, instance_path, monkeypatch):
+    monkeypatch.setattr(startup, 'init_db', lambda app: time.sleep(0.05))
+    app = create_app(make_config(), instance_path)
+
+    assert app.config['STARTUP_TIME'] >= 0.05
+
+
+def test_over_budget_startup_warns(make_config, instance_path, caplog):
+    with caplog.at_level(logging.WARNING):
+        create_app(make_config(STARTUP_TIME_BUDGET=1e-9), instance_path)
+
+    assert any('Startup took' in record.getMessage() and 'over the' in record.getMessage()
+               for record in caplog.records)